@@ -2,25 +2,40 @@ from rest_framework import status
 from rest_framework.permissions import BasePermission
 
 
-class IsManager(BasePermission):
-    message = "You don't have right permission to perfom this action."
-    status = status.HTTP_403_FORBIDDEN
+def user_group_names(user):
+    """Return the user's group names, fetched once and cached on the user."""
+    if not hasattr(user, "_cached_group_names"):
+        user._cached_group_names = set(user.groups.values_list("name", flat=True))
+    return user._cached_group_names
 
-    def has_permission(self, request, view):
-        return request.user.groups.filter(name="manager").exists()
 
+class InAnyGroup(BasePermission):
+    """Allow users who belong to at least one of ``required_groups``."""
 
-class IsCustomer(BasePermission):
     message = "You don't have right permission to perform this action."
     status = status.HTTP_403_FORBIDDEN
+    required_groups = frozenset()
 
     def has_permission(self, request, view):
-        return request.user.groups.filter(name="customer").exists()
+        return bool(user_group_names(request.user) & self.required_groups)
 
 
-class IsDeliveryCrew(BasePermission):
-    message = "You don't have right permission to perform this action."
-    status = status.HTTP_403_FORBIDDEN
+class IsManager(InAnyGroup):
+    message = "You don't have right permission to perfom this action."
+    required_groups = frozenset({"manager"})
 
-    def has_permission(self, request, view):
-        return request.user.groups.filter(name="delivery_crew").exists()
+
+class IsCustomer(InAnyGroup):
+    required_groups = frozenset({"customer"})
+
+
+class IsDeliveryCrew(InAnyGroup):
+    required_groups = frozenset({"delivery_crew"})
+
+
+class IsManagerOrDeliveryCrew(InAnyGroup):
+    required_groups = frozenset({"manager", "delivery_crew"})
+
+
+class HasAnyRole(InAnyGroup):
+    required_groups = frozenset({"customer", "manager", "delivery_crew"})
@@ -1,4 +1,6 @@
 from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.db.models import Prefetch, Sum, prefetch_related_objects
 from rest_framework import serializers, status
 from rest_framework.validators import UniqueTogetherValidator
 
@@ -53,44 +55,71 @@ class CartSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+class OrderItemSerializer(serializers.ModelSerializer):
+    menuitem = serializers.StringRelatedField()
+
+    class Meta:
+        model = OrderItem
+        fields = ["menuitem", "quantity", "unit_price", "price"]
+
+
 class OrderSerializer(serializers.ModelSerializer):
+    order_items = OrderItemSerializer(source="orderitem_set", many=True, read_only=True)
+
     class Meta:
         model = Order
-        fields = ["id", "user", "delivery_crew", "status", "total", "date"]
+        fields = [
+            "id",
+            "user",
+            "delivery_crew",
+            "status",
+            "total",
+            "date",
+            "order_items",
+        ]
         read_only_fields = ["user", "total", "date"]
 
+    @transaction.atomic
     def create(self, validated_data):
         user = self.context["request"].user
 
-        if not Cart.objects.filter(user=user).exists():
-            raise serializers.ValidationError(
-                detail="Cart is empty", code=status.HTTP_400_BAD_REQUEST
+        order = Order.objects.create(user=user, total=0)
+
+        # Copy the cart rows into order items with a single INSERT ... SELECT
+        # so no cart row is loaded into Python, however large the cart is.
+        quote_name = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO {} (order_id, menuitem_id, quantity, unit_price, price) "
+                "SELECT %s, menuitem_id, quantity, unit_price, price FROM {} "
+                "WHERE user_id = %s".format(
+                    quote_name(OrderItem._meta.db_table),
+                    quote_name(Cart._meta.db_table),
+                ),
+                [order.pk, user.pk],
             )
+            copied = cursor.rowcount
 
-        carts = Cart.objects.filter(user=user)
-        total = sum([cart.price for cart in carts])
-        order = Order.objects.create(user=user, total=total)
-
-        order_items = []
-        for cart in carts:
-            order_item = OrderItem(
-                order=order,
-                menuitem=cart.menuitem,
-                quantity=cart.quantity,
-                unit_price=cart.unit_price,
-                price=cart.price,
+        if not copied:
+            raise serializers.ValidationError(
+                detail="Cart is empty", code=status.HTTP_400_BAD_REQUEST
             )
-            order_items.append(order_item)
 
-        OrderItem.objects.bulk_create(order_items)
-        carts.delete()
+        # Take the total from, and clear, only what was copied, so a cart row
+        # added concurrently is neither billed nor dropped without an order.
+        order_items = OrderItem.objects.filter(order=order)
+        order.total = order_items.aggregate(total=Sum("price"))["total"]
+        order.save(update_fields=["total"])
+        Cart.objects.filter(
+            user=user, menuitem__in=order_items.values("menuitem")
+        ).delete()
+
+        prefetch_related_objects(
+            [order],
+            Prefetch(
+                "orderitem_set",
+                queryset=OrderItem.objects.select_related("menuitem"),
+            ),
+        )
 
         return order
-
-
-class OrderItemSerializer(serializers.ModelSerializer):
-    menuitem = serializers.StringRelatedField()
-
-    class Meta:
-        model = OrderItem
-        fields = ["menuitem", "quantity", "unit_price", "price"]
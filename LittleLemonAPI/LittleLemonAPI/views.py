@@ -1,16 +1,22 @@
 from django.contrib.auth.models import Group, User
+from django.db.models import Prefetch
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.throttling import UserRateThrottle
 
 from .models import Cart, Category, MenuItem, Order, OrderItem
-from .permissions import IsCustomer, IsDeliveryCrew, IsManager
+from .permissions import (
+    HasAnyRole,
+    IsCustomer,
+    IsManager,
+    IsManagerOrDeliveryCrew,
+    user_group_names,
+)
 from .serializers import (
     CartSerializer,
     CategorySerializer,
     MenuItemSerializer,
-    OrderItemSerializer,
     OrderSerializer,
     UserSerializer,
 )
@@ -32,7 +38,7 @@ class CartView(generics.ListAPIView, generics.CreateAPIView):
     shopping cart.
     """
 
-    queryset = Cart.objects.all()
+    queryset = Cart.objects.none()
     serializer_class = CartSerializer
     ordering_fields = ["price"]
     permission_classes = [IsAuthenticated]
@@ -44,8 +50,7 @@ class CartView(generics.ListAPIView, generics.CreateAPIView):
         return super().get_permissions()
 
     def get_queryset(self):
-        self.queryset = Cart.objects.filter(user=self.request.user)
-        return super().get_queryset()
+        return Cart.objects.filter(user=self.request.user)
 
     def get(self, request, *args, **kwargs):
         return self.list(request, *args, **kwargs)
@@ -54,14 +59,14 @@ class CartView(generics.ListAPIView, generics.CreateAPIView):
         return self.create(request, *args, **kwargs)
 
     def delete(self, request, *args, **kwargs):
-        if not self.get_queryset().exists():
+        deleted, _ = self.get_queryset().delete()
+
+        if not deleted:
             return Response(
                 {"message": "Cart is already empty."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        self.get_queryset().delete()
-
         return Response(status=status.HTTP_200_OK)
 
 
@@ -78,12 +83,14 @@ class GroupUsersView(generics.ListCreateAPIView, generics.DestroyAPIView):
     throttle_classes = [UserRateThrottle]
 
     def get_queryset(self):
-        group = Group.objects.get(name=self.group_name)
+        users = User.objects.filter(groups__name=self.group_name).only(
+            "id", "email", "username"
+        )
 
         if "pk" in self.kwargs:
-            return group.user_set.filter(id=self.kwargs["pk"])
+            return users.filter(id=self.kwargs["pk"])
         else:
-            return group.user_set.all()
+            return users
 
     def post(self, request, *args, **kwargs):
         username = request.data.get("username")
@@ -110,15 +117,15 @@ class GroupUsersView(generics.ListCreateAPIView, generics.DestroyAPIView):
 
     def delete(self, request, pk, *args, **kwargs):
         try:
-            user = User.objects.get(id=pk)
+            username = User.objects.values_list("username", flat=True).get(id=pk)
             group = Group.objects.get(name=self.group_name)
 
-            if user in group.user_set.all():
-                group.user_set.remove(user)
+            if group.user_set.filter(id=pk).exists():
+                group.user_set.remove(pk)
                 return Response(
                     {
                         "success": "User {} has been removed from {} group".format(
-                            user.username, self.group_name
+                            username, self.group_name
                         )
                     },
                     status=status.HTTP_200_OK,
@@ -128,7 +135,7 @@ class GroupUsersView(generics.ListCreateAPIView, generics.DestroyAPIView):
                 return Response(
                     {
                         "error": "User {} is not a member of {} group".format(
-                            user.username, self.group_name
+                            username, self.group_name
                         )
                     },
                     status=status.HTTP_400_BAD_REQUEST,
@@ -180,8 +187,9 @@ class OrdersView(generics.ListCreateAPIView):
     based on the user's group.
     """
 
-    queryset = Order.objects.all()
+    queryset = Order.objects.none()
     serializer_class = OrderSerializer
+    ordering = ["-date", "-id"]
     ordering_fields = ["id"]
     permission_classes = [IsAuthenticated]
     throttle_classes = [UserRateThrottle]
@@ -193,29 +201,26 @@ class OrdersView(generics.ListCreateAPIView):
 
     def get_queryset(self):
         user = self.request.user
-        group = user.groups.all()
-
-        if group.filter(name="manager").exists():
-            self.queryset = Order.objects.all()
+        group_names = user_group_names(user)
 
-        elif group.filter(name="customer").exists():
-            self.queryset = Order.objects.filter(user=user)
+        if "manager" in group_names:
+            queryset = Order.objects.all()
 
-        elif group.filter(name="delivery_crew").exists():
-            self.queryset = Order.objects.filter(delivery_crew__isnull=False)
+        elif "customer" in group_names:
+            queryset = Order.objects.filter(user=user)
 
-        return super().get_queryset()
+        elif "delivery_crew" in group_names:
+            queryset = Order.objects.filter(delivery_crew__isnull=False)
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        serialized = self.get_serializer(queryset, many=True)
-
-        for order_data in serialized.data:
-            order_items = OrderItem.objects.filter(order=order_data["id"])
-            order_item_serialized = OrderItemSerializer(order_items, many=True)
-            order_data["order_items"] = order_item_serialized.data
+        else:
+            queryset = Order.objects.none()
 
-        return Response(serialized.data, status=status.HTTP_200_OK)
+        return queryset.prefetch_related(
+            Prefetch(
+                "orderitem_set",
+                queryset=OrderItem.objects.select_related("menuitem"),
+            )
+        )
 
 
 class SingleMenuItemView(generics.RetrieveUpdateAPIView, generics.DestroyAPIView):
@@ -237,16 +242,16 @@ class SingleOrderView(
 ):
     """Retrieve, update and delete a single order item."""
 
-    queryset = Order.objects.all()
+    queryset = Order.objects.none()
     serializer_class = OrderSerializer
     throttle_classes = [UserRateThrottle]
 
     def get_permissions(self):
         if self.request.method in ["GET"]:
-            self.permission_classes = [IsCustomer | IsManager | IsDeliveryCrew]
+            self.permission_classes = [HasAnyRole]
 
         elif self.request.method in ["PATCH"]:
-            self.permission_classes = [IsManager | IsDeliveryCrew]
+            self.permission_classes = [IsManagerOrDeliveryCrew]
 
         elif self.request.method in ["DELETE"]:
             self.permission_classes = [IsManager]
@@ -255,18 +260,33 @@ class SingleOrderView(
 
     def get_queryset(self):
         user = self.request.user
-        group = user.groups.all()
+        group_names = user_group_names(user)
 
-        if group.filter(name="manager").exists():
-            self.queryset = Order.objects.all()
+        if "manager" in group_names:
+            queryset = Order.objects.all()
 
-        elif group.filter(name="customer").exists():
-            self.queryset = Order.objects.filter(user=user)
+        elif "customer" in group_names:
+            queryset = Order.objects.filter(user=user)
 
-        elif group.filter(name="delivery_crew").exists():
-            self.queryset = Order.objects.all()
+        elif "delivery_crew" in group_names:
+            queryset = Order.objects.all()
 
-        return super().get_queryset()
+        else:
+            queryset = Order.objects.none()
+
+        return queryset.prefetch_related(
+            Prefetch(
+                "orderitem_set",
+                queryset=OrderItem.objects.select_related("menuitem"),
+            )
+        )
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        # UpdateModelMixin.update drops the prefetch cache after this hook, and
+        # serializer.data is memoized, so render it now while the (read-only)
+        # order items are still prefetched with their menu items.
+        serializer.data
 
     def list(self, request, *args, **kwargs):
         order_id = kwargs.get("pk")
@@ -280,9 +300,5 @@ class SingleOrderView(
             )
 
         serialized = self.get_serializer(order)
-        serialized_data = serialized.data
-        order_items = OrderItem.objects.filter(order=order_id)
-        order_item_serialized = OrderItemSerializer(order_items, many=True)
-        serialized_data["order_items"] = order_item_serialized.data
 
-        return Response(serialized_data, status=status.HTTP_200_OK)
+        return Response(serialized.data, status=status.HTTP_200_OK)
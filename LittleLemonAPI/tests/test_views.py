@@ -0,0 +1,73 @@
+from decimal import Decimal
+
+from django.contrib.auth.models import Group, User
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from LittleLemonAPI.models import Cart, Category, MenuItem, Order, OrderItem
+
+
+class OrdersViewCreateTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="customer", password="pass")
+        self.other = User.objects.create_user(username="other", password="pass")
+        customers = Group.objects.create(name="customer")
+        customers.user_set.add(self.user, self.other)
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+        category = Category.objects.create(slug="mains", title="Mains")
+        self.pasta = MenuItem.objects.create(
+            title="Pasta", price=Decimal("6.50"), featured=False, category=category
+        )
+        self.pizza = MenuItem.objects.create(
+            title="Pizza", price=Decimal("9.00"), featured=False, category=category
+        )
+
+    def add_to_cart(self, user, menuitem, quantity):
+        Cart.objects.create(
+            user=user,
+            menuitem=menuitem,
+            quantity=quantity,
+            unit_price=menuitem.price,
+            price=menuitem.price * quantity,
+        )
+
+    def test_create_copies_cart_into_order(self):
+        self.add_to_cart(self.user, self.pasta, 2)
+        self.add_to_cart(self.user, self.pizza, 1)
+        self.add_to_cart(self.other, self.pizza, 3)
+
+        response = self.client.post("/api/orders")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        order = Order.objects.get(user=self.user)
+        self.assertEqual(order.total, Decimal("22.00"))
+        self.assertEqual(Decimal(response.data["total"]), Decimal("22.00"))
+
+        items = OrderItem.objects.filter(order=order).order_by("menuitem__title")
+        self.assertEqual(
+            [
+                (item.menuitem, item.quantity, item.unit_price, item.price)
+                for item in items
+            ],
+            [
+                (self.pasta, 2, Decimal("6.50"), Decimal("13.00")),
+                (self.pizza, 1, Decimal("9.00"), Decimal("9.00")),
+            ],
+        )
+        self.assertEqual(len(response.data["order_items"]), 2)
+
+        self.assertFalse(Cart.objects.filter(user=self.user).exists())
+        self.assertTrue(Cart.objects.filter(user=self.other).exists())
+
+    def test_create_with_empty_cart(self):
+        self.add_to_cart(self.other, self.pizza, 1)
+
+        response = self.client.post("/api/orders")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Order.objects.exists())
+        self.assertFalse(OrderItem.objects.exists())